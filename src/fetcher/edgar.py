@@ -2,16 +2,63 @@
 SEC EDGAR API client for fetching 13F filings.
 """
 
+import io
+import orjson
 import requests
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
+from xml.sax.saxutils import unescape
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import os
+import pickle
+import sys
+import threading
 import time
 import re
 
 
-@dataclass
+# Precompiled extractors for the regex fast path over info-table bytes.
+# 13F information tables are flat and schema-fixed, so a single linear
+# scan of the byte buffer recovers every field without building a DOM;
+# the ElementTree path below remains the fallback for any document the
+# scan does not recognize.
+_INFO_TABLE_RE = re.compile(rb"<(?:\w+:)?infoTable[\s>](.*?)</(?:\w+:)?infoTable>", re.S)
+
+# Close tags are trivial to count; the scan compares its match count
+# against this so a partially-matched document (e.g. an oddly wrapped
+# open tag) falls back to the tree parser instead of dropping entries.
+_INFO_TABLE_CLOSE_RE = re.compile(rb"</(?:\w+:)?infoTable>")
+
+
+def _field_pattern(tag: str) -> re.Pattern:
+    return re.compile(rb"<(?:\w+:)?" + tag.encode("ascii") + rb"\s*>\s*(.*?)\s*</", re.S)
+
+
+# unescape() only decodes &amp;/&lt;/&gt; by default; these two complete
+# the XML predefined set. Any entity beyond that (numeric references,
+# exotic names) makes the scan defer to the tree parser rather than leak
+# the raw reference into issuer names and tweets.
+_XML_ENTITIES = {"&apos;": "'", "&quot;": '"'}
+_UNRESOLVED_ENTITY_RE = re.compile(r"&(?:#\d+|#x[0-9a-fA-F]+|\w+);")
+
+# Deletion table for str.translate - faster than str.replace for
+# stripping the thousands separators out of numeric fields
+_COMMA_STRIP = str.maketrans("", "", ",")
+
+_FIELD_PATTERNS = {
+    tag: _field_pattern(tag)
+    for tag in (
+        "nameOfIssuer", "titleOfClass", "cusip", "value", "sshPrnamt",
+        "sshPrnamtType", "putCall", "investmentDiscretion",
+        "Sole", "Shared", "None",
+    )
+}
+
+
+@dataclass(slots=True, frozen=True)
 class Holding:
     """Represents a single holding in a 13F filing."""
     issuer: str
@@ -34,7 +81,7 @@ class Holding:
         return self.value
 
 
-@dataclass
+@dataclass(slots=True)
 class Filing:
     """Represents a 13F filing."""
     accession_number: str
@@ -42,16 +89,13 @@ class Filing:
     report_date: str
     form_type: str
     holdings: list[Holding]
+    # Computed once at construction instead of re-summing on every access
+    total_value: int = field(init=False, default=0)  # total portfolio value in USD
+    num_positions: int = field(init=False, default=0)
 
-    @property
-    def total_value(self) -> int:
-        """Total portfolio value in USD."""
-        return sum(h.value_usd for h in self.holdings)
-
-    @property
-    def num_positions(self) -> int:
-        """Number of positions in the portfolio."""
-        return len(self.holdings)
+    def __post_init__(self):
+        self.total_value = sum(h.value_usd for h in self.holdings)
+        self.num_positions = len(self.holdings)
 
 
 class EdgarClient:
@@ -63,31 +107,53 @@ class EdgarClient:
     # Atreides Management CIK
     ATREIDES_CIK = "0001777813"
 
+    # Filings are immutable once filed, so parsed Filing objects are
+    # cached on disk by accession number and never invalidated.
+    CACHE_DIR = Path.home() / ".cache" / "gavin-baker-tracker"
+
     # XML namespaces used in 13F filings
     NS = {
         "ns1": "http://www.sec.gov/edgar/document/thirteenf/informationtable",
         "ns2": "http://www.sec.gov/edgar/thirteenfholdingsinfo"
     }
 
-    def __init__(self, user_agent: str, cik: str = ATREIDES_CIK):
+    def __init__(self, user_agent: str, cik: str = ATREIDES_CIK, use_cache: bool = True):
         """
         Initialize the EDGAR client.
 
         Args:
             user_agent: Required by SEC - format: "Name email@example.com"
             cik: Company CIK number (default: Atreides Management)
+            use_cache: Whether to cache parsed filings on disk
         """
+        self.use_cache = use_cache
         self.cik = cik.zfill(10)  # Pad to 10 digits
         self.headers = {
             "User-Agent": user_agent,
             "Accept-Encoding": "gzip, deflate",
         }
+        # One session for all requests so TCP+TLS is reused across calls
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
         self._rate_limit_delay = 0.1  # 10 requests/second max
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+        self._history_cache: Optional[list[dict]] = None
+        self._history_by_accession: dict[str, dict] = {}
 
     def _request(self, url: str) -> requests.Response:
-        """Make a rate-limited request to SEC EDGAR."""
-        time.sleep(self._rate_limit_delay)
-        response = requests.get(url, headers=self.headers)
+        """Make a rate-limited request to SEC EDGAR.
+
+        The limiter hands out evenly spaced request slots under a lock,
+        so concurrent fetches still stay within the SEC's 10 req/s cap.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + self._rate_limit_delay
+        if wait > 0:
+            time.sleep(wait)
+        response = self.session.get(url)
         response.raise_for_status()
         return response
 
@@ -95,34 +161,46 @@ class EdgarClient:
         """
         Get list of 13F filings for the company.
 
+        The submissions index is fetched once per client and cached, so
+        repeated calls (e.g. metadata lookups for several filings) cost
+        no extra round-trips.
+
         Args:
             limit: Maximum number of filings to return
 
         Returns:
             List of filing metadata dicts
         """
-        url = f"{self.BASE_URL}/submissions/CIK{self.cik}.json"
-        response = self._request(url)
-        data = response.json()
-
-        filings = []
-        recent = data.get("filings", {}).get("recent", {})
-
-        forms = recent.get("form", [])
-        dates = recent.get("filingDate", [])
-        accessions = recent.get("accessionNumber", [])
-        report_dates = recent.get("reportDate", [])
-
-        for i, form in enumerate(forms):
-            if "13F" in form and len(filings) < limit:
-                filings.append({
-                    "form_type": form,
-                    "filed_date": dates[i],
-                    "accession_number": accessions[i],
-                    "report_date": report_dates[i] if i < len(report_dates) else None,
-                })
-
-        return filings
+        if self._history_cache is None:
+            url = f"{self.BASE_URL}/submissions/CIK{self.cik}.json"
+            response = self._request(url)
+            # orjson parses the few-hundred-KB submissions blob several
+            # times faster than the stdlib json module
+            data = orjson.loads(response.content)
+
+            filings = []
+            recent = data.get("filings", {}).get("recent", {})
+
+            forms = recent.get("form", [])
+            dates = recent.get("filingDate", [])
+            accessions = recent.get("accessionNumber", [])
+            report_dates = recent.get("reportDate", [])
+
+            for i, form in enumerate(forms):
+                if "13F" in form:
+                    filings.append({
+                        "form_type": form,
+                        "filed_date": dates[i],
+                        "accession_number": accessions[i],
+                        "report_date": report_dates[i] if i < len(report_dates) else None,
+                    })
+
+            self._history_cache = filings
+            self._history_by_accession = {
+                f["accession_number"]: f for f in filings
+            }
+
+        return self._history_cache[:limit]
 
     def get_filing(self, accession_number: str) -> Filing:
         """
@@ -134,13 +212,57 @@ class EdgarClient:
         Returns:
             Parsed Filing object with holdings
         """
+        # Get filing metadata from the cached history (one dict lookup)
+        if self._history_cache is None:
+            self.get_filing_history()
+        filing_meta = self._history_by_accession.get(accession_number)
+
+        return self._get_filing_with_meta(accession_number, filing_meta)
+
+    def _cache_path(self, accession_number: str) -> Path:
+        return self.CACHE_DIR / f"{accession_number}.pkl"
+
+    def _load_cached_filing(self, accession_number: str) -> Optional[Filing]:
+        """Load a parsed filing from the disk cache, if present."""
+        if not self.use_cache:
+            return None
+        try:
+            with open(self._cache_path(accession_number), "rb") as f:
+                filing = pickle.load(f)
+            # Touch the computed fields so entries pickled by an older
+            # version of the dataclass are discarded here, not at use time.
+            _ = filing.total_value, filing.num_positions
+            return filing
+        except (OSError, pickle.PickleError, EOFError, AttributeError):
+            return None
+
+    def _store_cached_filing(self, filing: Filing) -> None:
+        """Write a parsed filing to the disk cache (atomically)."""
+        if not self.use_cache:
+            return
+        try:
+            self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            path = self._cache_path(filing.accession_number)
+            tmp = path.with_suffix(".pkl.tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(filing, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+    def _get_filing_with_meta(self, accession_number: str, filing_meta: Optional[dict]) -> Filing:
+        """Fetch and parse a filing using already-known metadata."""
+        cached = self._load_cached_filing(accession_number)
+        if cached is not None:
+            return cached
+
         # Get filing index to find the information table file
         acc_clean = accession_number.replace("-", "")
         cik_clean = self.cik.lstrip("0")
 
         index_url = f"{self.ARCHIVES_URL}/{cik_clean}/{acc_clean}/index.json"
         index_response = self._request(index_url)
-        index_data = index_response.json()
+        index_data = orjson.loads(index_response.content)
 
         # Find the information table XML file
         info_table_file = None
@@ -165,119 +287,160 @@ class EdgarClient:
         table_url = f"{self.ARCHIVES_URL}/{cik_clean}/{acc_clean}/{info_table_file}"
         table_response = self._request(table_url)
 
-        holdings = self._parse_info_table(table_response.text)
+        # Pass the raw bytes through: both parser paths work on bytes, so
+        # there is no need to decode the document into a str (and back)
+        # just to parse it.
+        holdings = self._parse_info_table(table_response.content)
 
-        # Get filing metadata
-        filing_meta = None
-        for f in self.get_filing_history(limit=20):
-            if f["accession_number"] == accession_number:
-                filing_meta = f
-                break
-
-        return Filing(
+        filing = Filing(
             accession_number=accession_number,
             filed_date=filing_meta["filed_date"] if filing_meta else "",
             report_date=filing_meta["report_date"] if filing_meta else "",
             form_type=filing_meta["form_type"] if filing_meta else "13F-HR",
             holdings=holdings,
         )
+        self._store_cached_filing(filing)
+        return filing
 
-    def _parse_info_table(self, xml_content: str) -> list[Holding]:
+    @staticmethod
+    def _localname(tag: str) -> str:
+        """Strip the XML namespace from a tag ('{ns}infoTable' -> 'infoTable')."""
+        return tag.rsplit("}", 1)[-1]
+
+    def _parse_info_table(self, xml_content: str | bytes) -> list[Holding]:
         """Parse the 13F information table XML."""
+        if isinstance(xml_content, str):
+            xml_content = xml_content.encode("utf-8")
+
+        holdings = self._scan_info_table(xml_content)
+        if holdings is None:
+            holdings = self._parse_info_table_tree(xml_content)
+        return holdings
+
+    def _scan_info_table(self, xml_bytes: bytes) -> Optional[list[Holding]]:
+        """Extract holdings with the precompiled regex scan.
+
+        Returns None if the document does not match the expected shape,
+        in which case the caller falls back to the XML tree parser.
+        """
+        holdings = []
+
+        for match in _INFO_TABLE_RE.finditer(xml_bytes):
+            block = match.group(1)
+
+            def get_text(tag: str, default: str = "") -> str:
+                m = _FIELD_PATTERNS[tag].search(block)
+                if m is None:
+                    return default
+                text = unescape(m.group(1).decode("utf-8", "replace"), _XML_ENTITIES)
+                if "&" in text and _UNRESOLVED_ENTITY_RE.search(text):
+                    # Entity the scan doesn't decode - caught below and
+                    # the whole document goes to the tree parser.
+                    raise ValueError(f"unhandled entity in <{tag}>")
+                return text
+
+            def get_int(tag: str, default: int = 0) -> int:
+                text = get_text(tag)
+                if text:
+                    return int(text.translate(_COMMA_STRIP))
+                return default
+
+            try:
+                # Interned so the same issuer/CUSIP string in both
+                # filings shares one object (identity-fast-path compares
+                # in the diff, half the string memory)
+                holdings.append(Holding(
+                    issuer=sys.intern(get_text("nameOfIssuer")),
+                    title=sys.intern(get_text("titleOfClass")),
+                    cusip=sys.intern(get_text("cusip")),
+                    value=get_int("value"),
+                    shares=get_int("sshPrnamt"),
+                    share_type=get_text("sshPrnamtType") or "SH",
+                    put_call=get_text("putCall") or None,
+                    investment_discretion=get_text("investmentDiscretion", "SOLE"),
+                    voting_sole=get_int("Sole"),
+                    voting_shared=get_int("Shared"),
+                    voting_none=get_int("None"),
+                ))
+            except ValueError:
+                # Unexpected field contents - let the tree parser decide.
+                return None
+
+        # A scan that matched fewer entries than the document closes is
+        # incomplete (silent data loss); trust only a full extraction.
+        if len(holdings) != len(_INFO_TABLE_CLOSE_RE.findall(xml_bytes)):
+            return None
+
+        return holdings or None
+
+    def _parse_info_table_tree(self, xml_content: bytes) -> list[Holding]:
+        """Parse the information table with ElementTree (fallback path)."""
         holdings = []
 
-        # Try to parse with namespace
+        # Stream entries with iterparse instead of building the full tree:
+        # each infoTable element is parsed, converted, and cleared, so peak
+        # memory stays flat regardless of how many holdings the filing has.
+        # Matching on the local tag name handles all namespace variants.
         try:
-            root = ET.fromstring(xml_content)
+            for _, elem in ET.iterparse(io.BytesIO(xml_content), events=("end",)):
+                if self._localname(elem.tag) == "infoTable":
+                    holding = self._parse_holding(elem)
+                    if holding:
+                        holdings.append(holding)
+                    elem.clear()
         except ET.ParseError as e:
             raise ValueError(f"Failed to parse XML: {e}")
 
-        # Find all infoTable entries (try multiple namespace patterns)
-        entries = root.findall(".//ns1:infoTable", self.NS)
-        if not entries:
-            entries = root.findall(".//{http://www.sec.gov/edgar/document/thirteenf/informationtable}infoTable")
-        if not entries:
-            # Try without namespace
-            entries = root.findall(".//infoTable")
-
-        for entry in entries:
-            holding = self._parse_holding(entry)
-            if holding:
-                holdings.append(holding)
-
         return holdings
 
     def _parse_holding(self, entry: ET.Element) -> Optional[Holding]:
         """Parse a single holding entry from the XML."""
+        # One pass over the entry's children builds a {localname: element}
+        # map, so every field below is a single dict lookup regardless of
+        # which namespace spelling the filing uses.
+        children = {self._localname(c.tag): c for c in entry}
+
         def get_text(tag: str, default: str = "") -> str:
-            # Try with namespace
-            elem = entry.find(f"ns1:{tag}", self.NS)
-            if elem is None:
-                elem = entry.find(f"{{http://www.sec.gov/edgar/document/thirteenf/informationtable}}{tag}")
-            if elem is None:
-                elem = entry.find(tag)
+            elem = children.get(tag)
             return elem.text.strip() if elem is not None and elem.text else default
 
         def get_int(tag: str, default: int = 0) -> int:
             text = get_text(tag)
             if text:
-                # Remove commas and convert
-                return int(text.replace(",", ""))
+                return int(text.translate(_COMMA_STRIP))
             return default
 
-        # Get shrsOrPrnAmt sub-elements
-        shrs_elem = entry.find("ns1:shrsOrPrnAmt", self.NS)
-        if shrs_elem is None:
-            shrs_elem = entry.find("{http://www.sec.gov/edgar/document/thirteenf/informationtable}shrsOrPrnAmt")
-        if shrs_elem is None:
-            shrs_elem = entry.find("shrsOrPrnAmt")
-
+        # shrsOrPrnAmt and votingAuthority sub-elements get the same
+        # localname-map treatment
         shares = 0
         share_type = "SH"
+        shrs_elem = children.get("shrsOrPrnAmt")
         if shrs_elem is not None:
-            amt_elem = shrs_elem.find("ns1:sshPrnamt", self.NS)
-            if amt_elem is None:
-                amt_elem = shrs_elem.find("{http://www.sec.gov/edgar/document/thirteenf/informationtable}sshPrnamt")
-            if amt_elem is None:
-                amt_elem = shrs_elem.find("sshPrnamt")
+            shrs = {self._localname(c.tag): c for c in shrs_elem}
+            amt_elem = shrs.get("sshPrnamt")
             if amt_elem is not None and amt_elem.text:
-                shares = int(amt_elem.text.replace(",", ""))
-
-            type_elem = shrs_elem.find("ns1:sshPrnamtType", self.NS)
-            if type_elem is None:
-                type_elem = shrs_elem.find("{http://www.sec.gov/edgar/document/thirteenf/informationtable}sshPrnamtType")
-            if type_elem is None:
-                type_elem = shrs_elem.find("sshPrnamtType")
+                shares = int(amt_elem.text.translate(_COMMA_STRIP))
+            type_elem = shrs.get("sshPrnamtType")
             if type_elem is not None and type_elem.text:
                 share_type = type_elem.text.strip()
 
-        # Get voting authority sub-elements
-        voting_elem = entry.find("ns1:votingAuthority", self.NS)
-        if voting_elem is None:
-            voting_elem = entry.find("{http://www.sec.gov/edgar/document/thirteenf/informationtable}votingAuthority")
-        if voting_elem is None:
-            voting_elem = entry.find("votingAuthority")
-
         voting_sole = voting_shared = voting_none = 0
+        voting_elem = children.get("votingAuthority")
         if voting_elem is not None:
-            for vtype, attr in [("Sole", "voting_sole"), ("Shared", "voting_shared"), ("None", "voting_none")]:
-                v_elem = voting_elem.find(f"ns1:{vtype}", self.NS)
-                if v_elem is None:
-                    v_elem = voting_elem.find(f"{{http://www.sec.gov/edgar/document/thirteenf/informationtable}}{vtype}")
-                if v_elem is None:
-                    v_elem = voting_elem.find(vtype)
-                if v_elem is not None and v_elem.text:
-                    if attr == "voting_sole":
-                        voting_sole = int(v_elem.text.replace(",", ""))
-                    elif attr == "voting_shared":
-                        voting_shared = int(v_elem.text.replace(",", ""))
-                    else:
-                        voting_none = int(v_elem.text.replace(",", ""))
+            voting = {self._localname(c.tag): c for c in voting_elem}
+
+            def get_vote(tag: str) -> int:
+                v = voting.get(tag)
+                return int(v.text.translate(_COMMA_STRIP)) if v is not None and v.text else 0
+
+            voting_sole = get_vote("Sole")
+            voting_shared = get_vote("Shared")
+            voting_none = get_vote("None")
 
         return Holding(
-            issuer=get_text("nameOfIssuer"),
-            title=get_text("titleOfClass"),
-            cusip=get_text("cusip"),
+            issuer=sys.intern(get_text("nameOfIssuer")),
+            title=sys.intern(get_text("titleOfClass")),
+            cusip=sys.intern(get_text("cusip")),
             value=get_int("value"),
             shares=shares,
             share_type=share_type,
@@ -288,6 +451,18 @@ class EdgarClient:
             voting_none=voting_none,
         )
 
+    def get_latest_accession(self) -> str:
+        """Get the accession number of the most recent 13F filing.
+
+        Only needs the submissions index, so callers can check whether
+        a filing was already handled before paying for the full
+        download-and-parse of both filings.
+        """
+        history = self.get_filing_history(limit=1)
+        if not history:
+            raise ValueError("No 13F filings found")
+        return history[0]["accession_number"]
+
     def get_latest_filing(self) -> Filing:
         """Get the most recent 13F filing."""
         history = self.get_filing_history(limit=1)
@@ -301,7 +476,13 @@ class EdgarClient:
         if len(history) < 2:
             raise ValueError("Need at least 2 filings for comparison")
 
-        current = self.get_filing(history[0]["accession_number"])
-        previous = self.get_filing(history[1]["accession_number"])
-
-        return current, previous
+        # The two filings are independent, so download them concurrently;
+        # _request keeps the combined rate within the SEC's limit.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            current_future = executor.submit(
+                self._get_filing_with_meta, history[0]["accession_number"], history[0]
+            )
+            previous_future = executor.submit(
+                self._get_filing_with_meta, history[1]["accession_number"], history[1]
+            )
+            return current_future.result(), previous_future.result()
@@ -13,7 +13,6 @@ from datetime import datetime
 
 from src.fetcher import EdgarClient
 from src.analyzer import PortfolioAnalyzer
-from src.poster.twitter import TwitterPoster, DryRunPoster
 from src.state import StateManager
 
 
@@ -57,6 +56,16 @@ def main():
         default=None,
         help="Path to state file for tracking posted filings",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the on-disk filing cache and always re-download",
+    )
+    parser.add_argument(
+        "--refresh-cusip-cache",
+        action="store_true",
+        help="Re-download CUSIP-to-ticker source data even if it is fresh",
+    )
 
     args = parser.parse_args()
 
@@ -64,10 +73,28 @@ def main():
     print("=" * 60)
 
     # Initialize clients
-    edgar = EdgarClient(user_agent=args.user_agent)
+    edgar = EdgarClient(user_agent=args.user_agent, use_cache=not args.no_cache)
     analyzer = PortfolioAnalyzer(significance_threshold=args.threshold)
     state = StateManager(state_file=args.state_file)
 
+    # Check if already posted before downloading anything beyond the
+    # filing index - the common cron run exits here without fetching or
+    # parsing either filing.
+    if not args.dry_run and not args.summary_only and not args.force:
+        try:
+            latest_accession = edgar.get_latest_accession()
+        except Exception as e:
+            print(f"❌ Error fetching filings: {e}")
+            sys.exit(1)
+        if state.is_already_posted(latest_accession):
+            last = state.get_last_posted()
+            print(f"\n⏭️  Already posted this filing!")
+            print(f"   Accession: {latest_accession}")
+            print(f"   Posted at: {last.posted_at}")
+            print(f"   Tweet: https://x.com/i/status/{last.tweet_ids[0]}")
+            print("\n   Use --force to post again.")
+            sys.exit(0)
+
     # Fetch filings
     print("\n📥 Fetching 13F filings from SEC EDGAR...")
     try:
@@ -79,17 +106,6 @@ def main():
         print(f"❌ Error fetching filings: {e}")
         sys.exit(1)
 
-    # Check if already posted
-    if not args.dry_run and not args.summary_only and not args.force:
-        if state.is_already_posted(current.accession_number):
-            last = state.get_last_posted()
-            print(f"\n⏭️  Already posted this filing!")
-            print(f"   Accession: {current.accession_number}")
-            print(f"   Posted at: {last.posted_at}")
-            print(f"   Tweet: https://x.com/i/status/{last.tweet_ids[0]}")
-            print("\n   Use --force to post again.")
-            sys.exit(0)
-
     # Analyze changes
     print("\n🔍 Analyzing portfolio changes...")
     changes = analyzer.compare(current, previous)
@@ -109,6 +125,13 @@ def main():
     # Post to Twitter
     print("\n📤 Posting to X.com...")
 
+    # Imported here so --summary-only (and the no-changes exit) never pay
+    # the posting-stack import cost
+    from src.poster.twitter import TwitterPoster, DryRunPoster, CUSIPResolver
+
+    if args.refresh_cusip_cache:
+        CUSIPResolver.SOURCES_MARKER.unlink(missing_ok=True)
+
     if args.dry_run:
         poster = DryRunPoster()
     else:
@@ -1,20 +1,60 @@
 """
-X.com (Twitter) posting module using Tweepy.
+X.com (Twitter) posting module using the v2 API directly.
 """
 
+import csv
+import functools
+import io
+import itertools
 import json
 import os
-from datetime import datetime
+import pickle
+import re
+import shutil
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import tweepy
+import requests
+import requests.adapters
 from typing import Optional
 from src.analyzer.compare import PortfolioChanges, PositionChange
 
 
+# Key prefix separating remembered first-word fallback tickers from real
+# source data in the persistent cache, so a later successful source load
+# can supersede them (CUSIPs are alphanumeric, so no collisions).
+_FALLBACK_PREFIX = "fallback:"
+
+# Shared session for the CUSIP source downloads: one connection pool for
+# both pulls, plus automatic retries on transient SEC/GitHub errors.
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = "gavin-baker-tracker (CUSIP resolver)"
+_SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(
+        max_retries=requests.adapters.Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        )
+    ),
+)
+
+
 class CUSIPResolver:
     """Resolves CUSIP numbers to ticker symbols using free SEC data."""
 
-    CACHE_FILE = Path(__file__).parent.parent.parent / ".ticker_cache.json"
+    # Pickle loads a flat str->str dict several times faster than JSON
+    # and is roughly half the size on disk; the cache is Python-local so
+    # cross-language readability doesn't matter here.
+    CACHE_FILE = Path(__file__).parent.parent.parent / ".ticker_cache.pkl"
+    LEGACY_CACHE_FILE = Path(__file__).parent.parent.parent / ".ticker_cache.json"
+    # Sidecar marker recording when the remote sources were last pulled;
+    # its mtime gates the re-download below.
+    SOURCES_MARKER = CACHE_FILE.with_suffix(".sources.ts")
+    SOURCES_TTL = 86400 * 7  # re-download source data at most weekly
 
     def __init__(self):
         self._cache = self._load_cache()
@@ -24,71 +64,154 @@ class CUSIPResolver:
         """Load persistent cache from file."""
         if self.CACHE_FILE.exists():
             try:
-                with open(self.CACHE_FILE) as f:
-                    return json.load(f)
+                with open(self.CACHE_FILE, "rb") as f:
+                    return pickle.load(f)
+            except Exception:
+                pass
+        # One-time migration from the old JSON cache format
+        if self.LEGACY_CACHE_FILE.exists():
+            try:
+                with open(self.LEGACY_CACHE_FILE) as f:
+                    cache = json.load(f)
+                with open(self.CACHE_FILE, "wb") as f:
+                    pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+                return cache
             except Exception:
                 pass
         return {}
 
     def _save_cache(self) -> None:
-        """Save cache to file."""
+        """Save cache to file (atomically, so a crash can't truncate it)."""
+        tmp = self.CACHE_FILE.with_suffix(".pkl.tmp")
         try:
-            with open(self.CACHE_FILE, "w") as f:
-                json.dump(self._cache, f, indent=2)
+            with open(tmp, "wb") as f:
+                pickle.dump(self._cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.CACHE_FILE)
         except Exception:
-            pass
+            tmp.unlink(missing_ok=True)
 
     def _load_sources(self) -> None:
         """Load CUSIP data from free sources (lazy load)."""
         if self._loaded_sources:
             return
 
-        import requests
+        # Skip the 10-30s downloads entirely while the cached mapping is
+        # fresh; --refresh-cusip-cache deletes the marker to force a pull.
+        try:
+            if time.time() - self.SOURCES_MARKER.stat().st_mtime < self.SOURCES_TTL:
+                self._loaded_sources = True
+                return
+        except OSError:
+            pass
+
+        # The two sources are independent HTTP pulls, so fetch them in
+        # parallel; cached entries win over both, and FTD over GitHub.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            ftd_future = executor.submit(self._fetch_ftd)
+            github_future = executor.submit(self._fetch_github)
+            ftd = ftd_future.result()
+            github = github_future.result()
+
+        setdefault = self._cache.setdefault
+        for mapping in (ftd, github):
+            for cusip, symbol in mapping.items():
+                setdefault(cusip, symbol)
+
+        # Source data supersedes any first-word fallbacks remembered
+        # while it was unavailable.
+        stale = [
+            key for key in self._cache
+            if key.startswith(_FALLBACK_PREFIX)
+            and key[len(_FALLBACK_PREFIX):] in self._cache
+        ]
+        for key in stale:
+            del self._cache[key]
 
-        # Try SEC FTD data (has CUSIP -> Symbol mapping)
+        self._loaded_sources = True
+        self._save_cache()
+        # Only start the TTL clock when a source actually delivered data;
+        # an offline run would otherwise suppress downloads for a week
+        # and leave every CUSIP on the first-word fallback.
+        if ftd or github:
+            try:
+                self.SOURCES_MARKER.touch()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _fetch_ftd() -> dict[str, str]:
+        """Fetch the SEC fails-to-deliver extract (has CUSIP -> Symbol)."""
+        mapping: dict[str, str] = {}
         try:
-            # Get recent FTD file
             ftd_url = "https://www.sec.gov/files/data/fails-deliver-data/cnsfails202412b.zip"
-            resp = requests.get(ftd_url, timeout=30)
-            if resp.status_code == 200:
-                import io
-                import zipfile
-                import csv
-
-                with zipfile.ZipFile(io.BytesIO(resp.content)) as z:
+            # Stream the zip to a spooled temp file instead of holding the
+            # whole multi-MB body in memory (requests buffer + BytesIO copy);
+            # small responses stay in RAM, big ones spill to disk.
+            with _SESSION.get(ftd_url, timeout=30, stream=True) as resp:
+                if resp.status_code != 200:
+                    raise OSError(f"FTD download failed: {resp.status_code}")
+                spool = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+                shutil.copyfileobj(resp.raw, spool, length=64 * 1024)
+            with spool:
+                with zipfile.ZipFile(spool) as z:
                     for name in z.namelist():
                         if name.endswith('.txt'):
                             with z.open(name) as f:
-                                reader = csv.DictReader(
+                                # Plain csv.reader with column indices from
+                                # the header row is ~3x faster than
+                                # DictReader, which builds a dict per row -
+                                # the FTD extract runs to millions of rows.
+                                reader = csv.reader(
                                     io.TextIOWrapper(f, encoding='utf-8'),
                                     delimiter='|'
                                 )
+                                try:
+                                    header = next(reader)
+                                    ci = header.index('CUSIP')
+                                    si = header.index('SYMBOL')
+                                except (StopIteration, ValueError):
+                                    continue
+                                width = max(ci, si)
+                                setdefault = mapping.setdefault
                                 for row in reader:
-                                    cusip = row.get('CUSIP', '').strip()
-                                    symbol = row.get('SYMBOL', '').strip()
-                                    if cusip and symbol and cusip not in self._cache:
-                                        self._cache[cusip] = symbol
+                                    if len(row) <= width:
+                                        continue
+                                    cusip = row[ci].strip()
+                                    symbol = row[si].strip()
+                                    if cusip and symbol:
+                                        setdefault(cusip, symbol)
         except Exception:
             pass
+        return mapping
 
-        # Try GitHub yoshishima dataset as backup
+    @staticmethod
+    def _fetch_github() -> dict[str, str]:
+        """Fetch the GitHub yoshishima CUSIP dataset (backup source)."""
+        mapping: dict[str, str] = {}
         try:
             csv_url = "https://raw.githubusercontent.com/yoshishima/Stock_Data/master/CUSIP.csv"
-            resp = requests.get(csv_url, timeout=15)
+            resp = _SESSION.get(csv_url, timeout=15)
             if resp.status_code == 200:
-                import csv
-                import io
-                reader = csv.DictReader(io.StringIO(resp.text))
-                for row in reader:
-                    cusip = row.get('CUSIP', '').strip()
-                    symbol = row.get('Symbol', '').strip()
-                    if cusip and symbol and cusip not in self._cache:
-                        self._cache[cusip] = symbol
+                reader = csv.reader(io.StringIO(resp.text))
+                try:
+                    header = next(reader)
+                    ci = header.index('CUSIP')
+                    si = header.index('Symbol')
+                except (StopIteration, ValueError):
+                    header = None
+                if header is not None:
+                    width = max(ci, si)
+                    setdefault = mapping.setdefault
+                    for row in reader:
+                        if len(row) <= width:
+                            continue
+                        cusip = row[ci].strip()
+                        symbol = row[si].strip()
+                        if cusip and symbol:
+                            setdefault(cusip, symbol)
         except Exception:
             pass
-
-        self._loaded_sources = True
-        self._save_cache()
+        return mapping
 
     def resolve(self, cusip: str) -> str | None:
         """Resolve a CUSIP to ticker symbol."""
@@ -104,6 +227,11 @@ class CUSIPResolver:
         if cusip8 in self._cache:
             return self._cache[cusip8]
 
+        # A malformed CUSIP can never be in the source data; bail before
+        # a junk value from a bad XML row triggers the 10-30s download.
+        if not _CUSIP_RE.match(cusip):
+            return self._cache.get(_FALLBACK_PREFIX + cusip)
+
         # Load sources if needed
         if not self._loaded_sources:
             self._load_sources()
@@ -114,7 +242,23 @@ class CUSIPResolver:
             if cusip8 in self._cache:
                 return self._cache[cusip8]
 
-        return None
+        # Last resort: a fallback ticker remembered by an earlier run
+        return self._cache.get(_FALLBACK_PREFIX + cusip)
+
+    def remember(self, cusip: str, ticker: str) -> None:
+        """Record a fallback-derived ticker so later runs get it as a cache hit.
+
+        Fallbacks live under their own key prefix so they never mask real
+        source data: resolve() consults them last, and _load_sources drops
+        them once a source supplies the genuine ticker. The persistent
+        cache is only rewritten when the entry is actually new.
+        """
+        if not cusip or cusip in self._cache:
+            return
+        key = _FALLBACK_PREFIX + cusip
+        if key not in self._cache:
+            self._cache[key] = ticker
+            self._save_cache()
 
     def resolve_batch(self, cusips: list[str]) -> dict[str, str | None]:
         """Resolve multiple CUSIPs at once."""
@@ -125,21 +269,105 @@ class CUSIPResolver:
         return {cusip: self.resolve(cusip) for cusip in cusips}
 
 
-# Global resolver instance
-_resolver = None
-
+@functools.cache
 def get_resolver() -> CUSIPResolver:
-    global _resolver
-    if _resolver is None:
-        _resolver = CUSIPResolver()
-    return _resolver
+    """Process-wide resolver instance, built on first use."""
+    return CUSIPResolver()
+
+
+# A real CUSIP is 8-9 alphanumeric characters; anything else can never
+# resolve, so it should not trigger a source download.
+_CUSIP_RE = re.compile(r"^[A-Z0-9]{8,9}$")
+
+
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+           "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+# Days in each month; February says 29 and leap years are checked where
+# the table is consulted.
+_MONTH_DAYS = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Ordinal suffix for each day of the month, indexed by day (0 unused).
+_ORDINAL = ["th"] * 32
+for _day in (1, 21, 31):
+    _ORDINAL[_day] = "st"
+for _day in (2, 22):
+    _ORDINAL[_day] = "nd"
+for _day in (3, 23):
+    _ORDINAL[_day] = "rd"
+del _day
+
+
+@functools.lru_cache(maxsize=8)
+def _format_date_str(date_str: str) -> str:
+    """Format 'YYYY-MM-DD' as e.g. 'Sep 30th, 2025'.
+
+    Slice parsing instead of strptime: the format is fixed, and
+    strptime drags in the whole _strptime regex/locale machinery for
+    what is three int() calls and two table lookups here. Malformed
+    input is returned unchanged, matching the old behaviour.
+    """
+    if not date_str:
+        return ""
+    try:
+        if len(date_str) != 10 or date_str[4] != "-" or date_str[7] != "-":
+            raise ValueError
+        year = int(date_str[:4])
+        month = int(date_str[5:7])
+        day = int(date_str[8:10])
+        if not (1 <= month <= 12 and 1 <= day <= _MONTH_DAYS[month - 1]):
+            raise ValueError
+        if (
+            month == 2
+            and day == 29
+            and not (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0))
+        ):
+            raise ValueError
+        return f"{_MONTHS[month - 1]} {day}{_ORDINAL[day]}, {date_str[:4]}"
+    except ValueError:
+        return date_str
+
+
+@functools.lru_cache(maxsize=1024)
+def _ticker_for(issuer: str, cusip: str) -> str:
+    """Resolve a (issuer, cusip) pair to a $-prefixed ticker string.
+
+    Thread formatting asks for the same pair several times (header, top
+    holdings, buys/sells...); the lru_cache makes every repeat a single
+    dict hit. Entries stay valid for the process lifetime because the
+    resolver is a process-wide singleton.
+    """
+    if not cusip and not issuer:
+        return "$?"
+
+    resolver = get_resolver()
+    ticker = resolver.resolve(cusip)
+    if ticker:
+        return f"${ticker}"
+
+    # Fallback: first word of issuer. Persist it so the next run gets
+    # the same answer straight from the cache instead of re-deriving it
+    # (and re-missing the sources).
+    first_word = issuer.split()[0].upper() if issuer else "?"
+    resolver.remember(cusip, first_word)
+    return f"${first_word}"
+
+
+# Static tweet scaffolding, built once at import instead of per format
+# call. The trailing \n plus the "\n".join below yields the blank line
+# after each section header.
+_HOLDINGS_HEADER = "🏆 Top 5 Holdings:\n"
+_BUYS_HEADER = "📈 Biggest Buys:\n"
+_SELLS_HEADER = "📉 Biggest Sells:\n"
+_NEW_HEADER = "✨ Other New Positions:\n"
+_EXITS_HEADER = "👋 Exits:\n"
 
 
 class TwitterPoster:
     """Posts portfolio updates to X.com (Twitter)."""
 
     MAX_TWEET_LENGTH = 280
-    THREAD_DELAY = 1  # seconds between tweets in a thread
+    POST_INTERVAL = 1.0  # min seconds between tweets (self-pacing)
+    TWEETS_URL = "https://api.x.com/2/tweets"
 
     def __init__(
         self,
@@ -168,12 +396,44 @@ class TwitterPoster:
                 "TWITTER_ACCESS_TOKEN, and TWITTER_ACCESS_SECRET environment variables."
             )
 
-        self.client = tweepy.Client(
-            consumer_key=self.api_key,
-            consumer_secret=self.api_secret,
-            access_token=self.access_token,
-            access_token_secret=self.access_secret,
+        # The only endpoint this module calls is create-tweet, so a
+        # plain OAuth1-signed session replaces tweepy's whole client
+        # layer (models, pagination, auth handlers). Imported here rather
+        # than at module top so dry runs skip the oauthlib import cost.
+        from requests_oauthlib import OAuth1
+
+        self.session = requests.Session()
+        self.session.auth = OAuth1(
+            self.api_key,
+            self.api_secret,
+            self.access_token,
+            self.access_secret,
+        )
+        # A thread is inherently serial (each tweet replies to the previous
+        # ID), so the per-tweet overhead worth removing is the TLS
+        # handshake: pin a small keep-alive pool on the session so every
+        # post in a thread reuses one warm connection. Connection setup
+        # gets retried with backoff; note urllib3 deliberately does not
+        # retry POSTs on status codes, so a tweet that reached the API is
+        # never replayed (no duplicate tweets).
+        self.session.headers["Connection"] = "keep-alive"
+        self.session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=4,
+                max_retries=requests.adapters.Retry(
+                    total=3,
+                    connect=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                ),
+            ),
         )
+        # Evenly spaced posting slots, same scheme as the EDGAR client's
+        # limiter: pace proactively instead of bursting into a 429 and
+        # eating the API's header-driven sleep.
+        self._next_post_at = 0.0
 
     def post_tweet(self, text: str, reply_to: Optional[str] = None) -> str:
         """
@@ -186,25 +446,42 @@ class TwitterPoster:
         Returns:
             Tweet ID of the posted tweet
         """
+        # len() counts code points, which is the unit the API's limit is
+        # expressed in (emoji count as 2 weighted units but stay well
+        # within our margin), so no encode pass is needed just to
+        # validate length.
         if len(text) > self.MAX_TWEET_LENGTH:
             raise ValueError(f"Tweet exceeds {self.MAX_TWEET_LENGTH} characters: {len(text)}")
 
-        response = self.client.create_tweet(
-            text=text,
-            in_reply_to_tweet_id=reply_to,
-        )
-        return response.data["id"]
+        now = time.monotonic()
+        wait = self._next_post_at - now
+        self._next_post_at = max(now, self._next_post_at) + self.POST_INTERVAL
+        if wait > 0:
+            time.sleep(wait)
+
+        payload: dict = {"text": text}
+        if reply_to:
+            payload["reply"] = {"in_reply_to_tweet_id": reply_to}
+
+        response = self.session.post(self.TWEETS_URL, json=payload, timeout=15)
+        response.raise_for_status()
+        return response.json()["data"]["id"]
 
     def post_portfolio_update(self, changes: PortfolioChanges) -> list[str]:
         """
         Post a portfolio update as a thread.
 
+        Each tweet replies to the previous one's ID, so the posts are
+        inherently sequential; concurrency can't shorten the chain, only
+        connection reuse can (see the adapter mounted in __init__).
+
         Args:
             changes: Portfolio changes to post
 
         Returns:
             List of tweet IDs in the thread
         """
+        self._prefetch_tickers(changes)
         tweets = self._format_thread(changes)
         tweet_ids = []
 
@@ -216,6 +493,27 @@ class TwitterPoster:
 
         return tweet_ids
 
+    def _prefetch_tickers(self, changes: PortfolioChanges) -> None:
+        """Resolve every CUSIP the tweets may mention in one batch.
+
+        The resolver downloads its source data on the first cache miss,
+        which can stall for many seconds; doing it up front pays that
+        cost in one place instead of midway through formatting a tweet.
+        """
+        cusips = {
+            p.cusip
+            for p in itertools.chain(
+                changes.new_positions,
+                changes.closed_positions,
+                changes.increased_positions,
+                changes.decreased_positions,
+                changes.get_top_positions(5),
+            )
+            if p.cusip
+        }
+        if cusips:
+            get_resolver().resolve_batch(list(cusips))
+
     def _format_thread(self, changes: PortfolioChanges) -> list[str]:
         """Format portfolio changes into a thread of tweets."""
         tweets = []
@@ -225,12 +523,13 @@ class TwitterPoster:
         change_pct = changes.total_value_change_pct
         change_sign = "+" if change_pct >= 0 else ""
 
-        # Get top tickers for header
-        top_buys = changes.get_top_buys(3)
-        top_sells = changes.get_top_sells(3)
+        # Get top movers once; the header uses the first 3, the buy/sell
+        # tweets the full 5 — no need to rank twice.
+        top_buys = changes.get_top_buys(5)
+        top_sells = changes.get_top_sells(5)
 
-        buy_tickers = ", ".join([self._get_ticker(p.issuer, p.cusip) for p in top_buys])
-        sell_tickers = ", ".join([self._get_ticker(p.issuer, p.cusip) for p in top_sells])
+        buy_tickers = ", ".join([self._get_ticker(p.issuer, p.cusip) for p in top_buys[:3]])
+        sell_tickers = ", ".join([self._get_ticker(p.issuer, p.cusip) for p in top_sells[:3]])
 
         date_formatted = self._format_date(changes.current_date)
         header = (
@@ -242,56 +541,84 @@ class TwitterPoster:
         )
         tweets.append(header)
 
+        # Each body is built as a list of lines joined once at the end;
+        # repeated str += re-allocates the growing string per append.
+        # A position can appear in up to three sections, so its weight
+        # strings are formatted once and reused from a small dict.
+        weight_strs: dict[int, tuple[str, str, str]] = {}
+
+        def wf(pos) -> tuple[str, str, str]:
+            entry = weight_strs.get(id(pos))
+            if entry is None:
+                entry = (
+                    f"{pos.current_weight:.1f}",
+                    f"{pos.weight_change:.1f}",
+                    # UnchangedPosition rows (holdings section only) have
+                    # no previous weight
+                    f"{pos.previous_weight:.1f}" if isinstance(pos, PositionChange) else "",
+                )
+                weight_strs[id(pos)] = entry
+            return entry
+
         # Top holdings tweet
         top_holdings = changes.get_top_positions(5)
         if top_holdings:
-            holdings_tweet = "🏆 Top 5 Holdings:\n\n"
+            lines = [_HOLDINGS_HEADER]
             for pos in top_holdings:
-                delta = f"+{pos.weight_change:.1f}%" if pos.weight_change > 0 else f"{pos.weight_change:.1f}%"
-                holdings_tweet += f"{pos.current_weight:.1f}% {self._get_ticker(pos.issuer, pos.cusip)} ({delta})\n"
-            tweets.append(holdings_tweet.strip())
+                cur, chg, _ = wf(pos)
+                delta = f"+{chg}%" if pos.weight_change > 0 else f"{chg}%"
+                lines.append(f"{cur}% {self._get_ticker(pos.issuer, pos.cusip)} ({delta})")
+            tweets.append("\n".join(lines))
 
         # Purchases tweet
-        top_buys = changes.get_top_buys(5)
         if top_buys:
-            buys_tweet = "📈 Biggest Buys:\n\n"
+            lines = [_BUYS_HEADER]
             for pos in top_buys:
+                cur, chg, _ = wf(pos)
                 if pos.change_type == "new":
-                    buys_tweet += f"+{pos.current_weight:.1f}% {self._get_ticker(pos.issuer, pos.cusip)} 🆕\n"
+                    lines.append(f"+{cur}% {self._get_ticker(pos.issuer, pos.cusip)} 🆕")
                 else:
-                    buys_tweet += f"+{pos.weight_change:.1f}% {self._get_ticker(pos.issuer, pos.cusip)}\n"
-            tweets.append(buys_tweet.strip())
+                    lines.append(f"+{chg}% {self._get_ticker(pos.issuer, pos.cusip)}")
+            tweets.append("\n".join(lines))
 
         # Sales tweet
-        top_sells = changes.get_top_sells(5)
         if top_sells:
-            sells_tweet = "📉 Biggest Sells:\n\n"
+            lines = [_SELLS_HEADER]
             for pos in top_sells:
+                _, chg, prev = wf(pos)
                 if pos.change_type == "closed":
-                    sells_tweet += f"-{pos.previous_weight:.1f}% {self._get_ticker(pos.issuer, pos.cusip)} 🚪\n"
+                    lines.append(f"-{prev}% {self._get_ticker(pos.issuer, pos.cusip)} 🚪")
                 else:
-                    sells_tweet += f"{pos.weight_change:.1f}% {self._get_ticker(pos.issuer, pos.cusip)}\n"
-            tweets.append(sells_tweet.strip())
+                    lines.append(f"{chg}% {self._get_ticker(pos.issuer, pos.cusip)}")
+            tweets.append("\n".join(lines))
 
         # New positions tweet (if any beyond top buys)
-        new_not_in_top = [p for p in changes.new_positions if p not in top_buys][:5]
+        top_buy_cusips = {p.cusip for p in top_buys}
+        new_not_in_top = [p for p in changes.new_positions if p.cusip not in top_buy_cusips][:5]
         if new_not_in_top:
-            new_tweet = "✨ Other New Positions:\n\n"
+            lines = [_NEW_HEADER]
             for pos in new_not_in_top:
-                new_tweet += f"{pos.current_weight:.1f}% {self._get_ticker(pos.issuer, pos.cusip)}\n"
-            tweets.append(new_tweet.strip())
+                lines.append(f"{wf(pos)[0]}% {self._get_ticker(pos.issuer, pos.cusip)}")
+            tweets.append("\n".join(lines))
 
         # Exits tweet (if any beyond top sells)
-        exits_not_in_top = [p for p in changes.closed_positions if p not in top_sells][:5]
+        top_sell_cusips = {p.cusip for p in top_sells}
+        exits_not_in_top = [p for p in changes.closed_positions if p.cusip not in top_sell_cusips][:5]
         if exits_not_in_top:
-            exits_tweet = "👋 Exits:\n\n"
+            lines = [_EXITS_HEADER]
             for pos in exits_not_in_top:
-                exits_tweet += f"(was {pos.previous_weight:.1f}%) {self._get_ticker(pos.issuer, pos.cusip)}\n"
-            tweets.append(exits_tweet.strip())
+                lines.append(f"(was {wf(pos)[2]}%) {self._get_ticker(pos.issuer, pos.cusip)}")
+            tweets.append("\n".join(lines))
 
         return tweets
 
-    def _get_quarter(self, date_str: str) -> str:
+    # Pure string-to-string helpers over a handful of distinct dates per
+    # run, so a small lru_cache turns the repeat calls into dict hits
+    # (same treatment as _format_date_str and _ticker_for above).
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _get_quarter(date_str: str) -> str:
         """Extract quarter from date string (YYYY-MM-DD)."""
         if not date_str:
             return "?"
@@ -301,7 +628,9 @@ class TwitterPoster:
         except (IndexError, ValueError):
             return "?"
 
-    def _get_year(self, date_str: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _get_year(date_str: str) -> str:
         """Extract year from date string (YYYY-MM-DD)."""
         if not date_str:
             return ""
@@ -312,34 +641,11 @@ class TwitterPoster:
 
     def _format_date(self, date_str: str) -> str:
         """Format date string (YYYY-MM-DD) to readable format like 'Sep 30th, 2025'."""
-        if not date_str:
-            return ""
-        try:
-            dt = datetime.strptime(date_str, "%Y-%m-%d")
-            day = dt.day
-            # Add ordinal suffix
-            if 11 <= day <= 13:
-                suffix = "th"
-            else:
-                suffix = {1: "st", 2: "nd", 3: "rd"}.get(day % 10, "th")
-            return dt.strftime(f"%b {day}{suffix}, %Y")
-        except ValueError:
-            return date_str
+        return _format_date_str(date_str)
 
     def _get_ticker(self, issuer: str, cusip: str = "") -> str:
         """Get ticker from CUSIP using SEC data."""
-        if not cusip and not issuer:
-            return "$?"
-
-        # Try resolver
-        resolver = get_resolver()
-        ticker = resolver.resolve(cusip)
-        if ticker:
-            return f"${ticker}"
-
-        # Fallback: first word of issuer
-        first_word = issuer.split()[0].upper() if issuer else "?"
-        return f"${first_word}"
+        return _ticker_for(issuer, cusip)
 
     def format_single_tweet(self, changes: PortfolioChanges) -> str:
         """
@@ -351,15 +657,17 @@ class TwitterPoster:
         Returns:
             Formatted tweet string
         """
+        self._prefetch_tickers(changes)
+
         value_b = changes.current_total_value / 1_000_000_000
         change_pct = changes.total_value_change_pct
         change_sign = "+" if change_pct >= 0 else ""
         date_formatted = self._format_date(changes.current_date)
 
-        tweet = (
+        parts = [
             f"Atreides 13F - {date_formatted}\n\n"
             f"AUM: ${value_b:.2f}B ({change_sign}{change_pct:.1f}%)\n\n"
-        )
+        ]
 
         # Add top move up and down
         top_buy = changes.get_top_buys(1)
@@ -368,28 +676,30 @@ class TwitterPoster:
         if top_buy:
             pos = top_buy[0]
             if pos.change_type == "new":
-                tweet += f"Top buy: {self._get_ticker(pos.issuer, pos.cusip)} +{pos.current_weight:.1f}% (NEW)\n"
+                parts.append(f"Top buy: {self._get_ticker(pos.issuer, pos.cusip)} +{pos.current_weight:.1f}% (NEW)\n")
             else:
-                tweet += f"Top buy: {self._get_ticker(pos.issuer, pos.cusip)} +{pos.weight_change:.1f}%\n"
+                parts.append(f"Top buy: {self._get_ticker(pos.issuer, pos.cusip)} +{pos.weight_change:.1f}%\n")
 
         if top_sell:
             pos = top_sell[0]
             if pos.change_type == "closed":
-                tweet += f"Top sale: {self._get_ticker(pos.issuer, pos.cusip)} -{pos.previous_weight:.1f}% (EXIT)\n"
+                parts.append(f"Top sale: {self._get_ticker(pos.issuer, pos.cusip)} -{pos.previous_weight:.1f}% (EXIT)\n")
             else:
-                tweet += f"Top sale: {self._get_ticker(pos.issuer, pos.cusip)} {pos.weight_change:.1f}%\n"
+                parts.append(f"Top sale: {self._get_ticker(pos.issuer, pos.cusip)} {pos.weight_change:.1f}%\n")
 
-        tweet += f"\n{changes.num_changes} changes | SEC EDGAR"
+        parts.append(f"\n{changes.num_changes} changes | SEC EDGAR")
 
-        return tweet
+        return "".join(parts)
 
 
 class DryRunPoster(TwitterPoster):
     """Mock poster for testing without actually posting to Twitter."""
 
     def __init__(self):
-        # Skip parent __init__ which requires credentials
-        pass
+        # Skip parent __init__ which requires credentials.
+        # A counter gives deterministic IDs, unlike hash(text) which
+        # varies per process (PYTHONHASHSEED) and walks the whole string.
+        self._counter = itertools.count(1)
 
     def post_tweet(self, text: str, reply_to: Optional[str] = None) -> str:
         print(f"\n{'='*50}")
@@ -399,9 +709,10 @@ class DryRunPoster(TwitterPoster):
         print(f"{'='*50}")
         if reply_to:
             print(f"(Reply to: {reply_to})")
-        return f"dry_run_{hash(text)}"
+        return f"dry_run_{next(self._counter)}"
 
     def post_portfolio_update(self, changes: PortfolioChanges) -> list[str]:
+        self._prefetch_tickers(changes)
         tweets = self._format_thread(changes)
 
         print("\n" + "="*60)
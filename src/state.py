@@ -2,7 +2,7 @@
 State management to track posted filings and prevent duplicates.
 """
 
-import json
+import orjson
 import os
 from dataclasses import dataclass, asdict
 from datetime import datetime
@@ -32,19 +32,34 @@ class StateManager:
             state_file: Path to state file (default: .gavin-baker-state.json in cwd)
         """
         self.state_file = Path(state_file or self.DEFAULT_STATE_FILE)
+        # Parsed state plus the file mtime it corresponds to, so repeat
+        # checks cost one stat() instead of a read+parse; an mtime change
+        # (external edit) invalidates the cached copy.
+        self._cached: Optional[PostState] = None
+        self._cached_mtime: float = -1.0
 
     def get_last_posted(self) -> Optional[PostState]:
         """Get the last posted filing state."""
-        if not self.state_file.exists():
+        try:
+            mtime = self.state_file.stat().st_mtime
+        except OSError:
+            self._cached = None
+            self._cached_mtime = -1.0
             return None
 
+        if self._cached is not None and mtime == self._cached_mtime:
+            return self._cached
+
         try:
-            with open(self.state_file, "r") as f:
-                data = json.load(f)
-                return PostState(**data)
-        except (json.JSONDecodeError, KeyError, TypeError):
+            data = orjson.loads(self.state_file.read_bytes())
+            state = PostState(**data)
+        except (orjson.JSONDecodeError, OSError, KeyError, TypeError):
             return None
 
+        self._cached = state
+        self._cached_mtime = mtime
+        return state
+
     def save_posted(self, accession_number: str, report_date: str, tweet_ids: list[str]) -> None:
         """
         Save the posted filing state.
@@ -61,8 +76,15 @@ class StateManager:
             tweet_ids=tweet_ids,
         )
 
-        with open(self.state_file, "w") as f:
-            json.dump(asdict(state), f, indent=2)
+        # Write to a sibling temp file and rename over the state file so
+        # a crash mid-write can't leave a truncated state that would make
+        # the next run re-post the same filing.
+        tmp = self.state_file.with_suffix(".json.tmp")
+        tmp.write_bytes(orjson.dumps(asdict(state), option=orjson.OPT_INDENT_2))
+        os.replace(tmp, self.state_file)
+
+        self._cached = state
+        self._cached_mtime = self.state_file.stat().st_mtime
 
     def is_already_posted(self, accession_number: str) -> bool:
         """
@@ -83,3 +105,5 @@ class StateManager:
         """Clear the state file (useful for testing)."""
         if self.state_file.exists():
             self.state_file.unlink()
+        self._cached = None
+        self._cached_mtime = -1.0